@@ -9,11 +9,11 @@ Classes:
 Functions:
     from_playlist_entry
 """
+import functools
 import json
 import logging
-import shlex
 from enum import Enum
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 
 from ipytv import m3u
 from ipytv.exceptions import MalformedExtinfException
@@ -63,9 +63,6 @@ class M3UEntry:
                and self.name == other.name \
                and self.duration == other.duration
 
-    def __ne__(self, other: object) -> bool:
-        return not self.__eq__(other)
-
 
 class IPTVAttr(Enum):
     """
@@ -138,9 +135,6 @@ class IPTVChannel(M3UEntry):
             and self.attributes == other.attributes \
             and self.extras == other.extras
 
-    def __ne__(self, other: object) -> bool:
-        return not self.__eq__(other)
-
     def copy(self) -> 'IPTVChannel':
         """
         .. py:method:: Returns a copy of the object it's invoked on
@@ -165,21 +159,17 @@ class IPTVChannel(M3UEntry):
         :param str extinf_string:   The whole #EXTINF string as found in an IPTV
                                     playlist
         """
-        match = m3u.match_m3u_plus_extinf_row(extinf_string)
-        if match is not None:
+        parsed = _parse_well_formed_extinf(extinf_string)
+        if parsed is not None:
             # Case of a well-formed EXTINF row
-            log.info("parsing a well-formed EXTINF row:\n%s", extinf_string)
-            self.duration = match.group("duration_g")
-            log.info("duration: %s", self.duration)
-            attributes = match.group("attributes_g")
-            for entry in shlex.split(attributes):
-                pair = entry.split("=", 1)
-                key = pair[0]
-                value = pair[1]
-                self.attributes[key] = value
-            log.info("attributes: %s", self.attributes)
-            self.name = match.group("name_g")
-            log.info("name: %s", self.name)
+            self.duration, attributes, self.name = parsed
+            # update() copies the (cached, thus shared) attributes dictionary
+            self.attributes.update(attributes)
+            if log.isEnabledFor(logging.INFO):
+                log.info("parsing a well-formed EXTINF row:\n%s", extinf_string)
+                log.info("duration: %s", self.duration)
+                log.info("attributes: %s", self.attributes)
+                log.info("name: %s", self.name)
             return
 
         match = m3u.match_m3u_plus_broken_extinf_row(extinf_string)
@@ -216,22 +206,15 @@ class IPTVChannel(M3UEntry):
         return out
 
     def _build_m3u_plus_extinf_entry(self) -> str:
-        extinf_pattern = '#EXTINF:{}{},{}\n'
+        # A channel only has a handful of attributes, and appending to a local
+        # string is faster than a join for so few (and short) pieces
         attrs = ''
         for key, value in self.attributes.items():
             attrs += f' {key}="{value}"'
-        return extinf_pattern.format(
-            self.duration,
-            attrs,
-            self.name
-        )
+        return f'#EXTINF:{self.duration}{attrs},{self.name}\n'
 
     def _build_m3u8_extinf_entry(self) -> str:
-        extinf_pattern = '#EXTINF:{},{}\n'
-        return extinf_pattern.format(
-            self.duration,
-            self.name
-        )
+        return f'#EXTINF:{self.duration},{self.name}\n'
 
     def _build_extras_entry(self) -> str:
         out = ''
@@ -304,6 +287,21 @@ class IPTVChannel(M3UEntry):
         return json.dumps(self.to_dict())
 
 
+@functools.lru_cache(maxsize=4096)
+def _parse_well_formed_extinf(extinf_string: str) -> Optional[Tuple[str, Dict[str, str], str]]:
+    # Playlists often repeat the very same #EXTINF row (e.g. for backup
+    # streams of a channel), so the parsing results are cached. The returned
+    # dictionary is shared between callers and must never be modified.
+    match = m3u.match_m3u_plus_extinf_row(extinf_string)
+    if match is None:
+        return None
+    return (
+        match.group("duration_g"),
+        m3u.get_m3u_plus_attributes(match.group("attributes_g")),
+        match.group("name_g")
+    )
+
+
 def from_playlist_entry(entry: List[str]) -> 'IPTVChannel':
     """
     .. py:function:: from_playlist_entry(entry)
@@ -329,12 +327,11 @@ def from_playlist_entry(entry: List[str]) -> 'IPTVChannel':
                 channel.parse_extinf_string(row)
             except MalformedExtinfException:
                 log.warning("Skipping the following entry as it contains a malformed #EXTINF row:\n%s", entry)
-            log.info("#EXTINF row found")
         elif m3u.is_comment_or_tag_row(row):
             # a comment or a non-supported tag, we add it to extras
             channel.extras.append(row)
             log.warning("commented row or unsupported tag found:\n%s", row)
-        elif m3u.is_url_row(row):
+        elif not m3u.is_empty_row(row):
+            # neither a tag nor a comment (header included), so it's a url row
             channel.url = row
-            log.info("URL row found")
     return channel
@@ -6,6 +6,7 @@ Functions:
     is_m3u_plus_extinf_row
     match_m3u_plus_broken_extinf_row
     get_m3u_plus_broken_attributes
+    get_m3u_plus_attributes
     match_m3u_plus_extinf_row
     is_extinf_row
     is_comment_or_tag_row
@@ -13,11 +14,16 @@ Functions:
 
 Constants:
     M3U_HEADER_TAG
+    M3U_EXTINF_TAG
+    M3U_COMMENT_TAG
 """
 import re
+import sys
 from typing import Optional, Dict
 
 M3U_HEADER_TAG = "#EXTM3U"
+M3U_EXTINF_TAG = "#EXTINF"
+M3U_COMMENT_TAG = "#"
 __M3U_EXTINF_REGEX = r'^#EXTINF:[-0-9\.]+,.*$'
 __M3U_PLUS_EXTINF_REGEX = r'^#EXTINF:[-0-9\.]+(\s+[\w-]+="[^"]*")+,.*$'
 __M3U_PLUS_EXTINF_PARSE_REGEX = r'^#EXTINF:(?P<duration_g>[-0-9\.]+)' \
@@ -27,6 +33,7 @@ __M3U_PLUS_BROKEN_EXTINF_PARSE_REGEX = r'^#EXTINF:(?P<duration_g>[-0-9\.]+)' \
     r'(?P<attributes_g>(\s+[\w-]+=".*)*),' \
     r'(?P<name_g>.*)'
 __M3U_PLUS_BROKEN_ATTRIBUTE_PARSE_REGEX = r'(?:\s+)[\w-]+="'
+__M3U_PLUS_ATTRIBUTE_PARSE_REGEX = re.compile(r'([\w-]+)="([^"]*)"')
 
 
 def is_m3u_header_row(row: str) -> bool:
@@ -67,7 +74,7 @@ def get_m3u_plus_broken_attributes(row: str) -> Dict[str, str]:
     tokens = re.findall(__M3U_PLUS_BROKEN_ATTRIBUTE_PARSE_REGEX, attributes)
     attrs = {}
     for i, token in enumerate(tokens):
-        name = token.lstrip().rstrip('="')
+        name = sys.intern(token.lstrip().rstrip('="'))
         right = row.split(token)[1]
         separator = tokens[i+1] if i < len(tokens)-1 else '",'
         left = right.split(separator)[0].rstrip('"')
@@ -76,16 +83,28 @@ def get_m3u_plus_broken_attributes(row: str) -> Dict[str, str]:
     return attrs
 
 
+def get_m3u_plus_attributes(attributes: str) -> Dict[str, str]:
+    """Parses the attribute list of a well-formed EXTINF row (i.e. the
+    "attributes_g" group of a match_m3u_plus_extinf_row() match) into a
+    dictionary. Attribute names are interned, as the same few names are
+    repeated on every channel of a playlist.
+    """
+    return {
+        sys.intern(name): value
+        for name, value in __M3U_PLUS_ATTRIBUTE_PARSE_REGEX.findall(attributes)
+    }
+
+
 def match_m3u_plus_extinf_row(row: str) -> Optional[re.Match]:
     return re.match(__M3U_PLUS_EXTINF_PARSE_REGEX, row)
 
 
 def is_extinf_row(row: str) -> bool:
-    return row.startswith("#EXTINF")
+    return row.startswith(M3U_EXTINF_TAG)
 
 
 def is_comment_or_tag_row(row: str) -> bool:
-    return row.startswith('#')
+    return row.startswith(M3U_COMMENT_TAG)
 
 
 def is_empty_row(row: str) -> bool:
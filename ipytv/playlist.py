@@ -10,19 +10,28 @@ Functions:
     loadu
     loadj
     loadjstr
+    set_session
+    close_pool
 """
+import atexit
+import functools
 import json
 import logging
-import math
 import multiprocessing as mp
+import os
 import re
+import sys
+import threading
 import typing
-from multiprocessing.pool import AsyncResult
-from typing import List, Dict, Tuple, Optional, Union, Any
+from collections import abc, defaultdict
+from itertools import chain, islice
+from multiprocessing.pool import Pool
+from typing import List, Dict, Tuple, Optional, Union, Any, Callable, Iterator, Iterable
 
 import jsonschema
 import requests
 from requests import RequestException
+from requests.adapters import HTTPAdapter, Retry
 
 import ipytv.channel
 from ipytv import m3u
@@ -30,13 +39,137 @@ from ipytv.channel import IPTVChannel, IPTVAttr
 from ipytv.exceptions import MalformedPlaylistException, URLException, \
     WrongTypeException, IndexOutOfBoundsException, \
     AttributeAlreadyPresentException, AttributeNotFoundException
-from ipytv.m3u import M3U_HEADER_TAG
+from ipytv.m3u import M3U_HEADER_TAG, M3U_EXTINF_TAG, M3U_COMMENT_TAG
 
 log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
 
 # The value of __MIN_CHUNK_SIZE cannot be smaller than 2
 __MIN_CHUNK_SIZE = 100
+# Each worker process should get at least this many chunks worth of rows,
+# otherwise the cost of spawning the process outweighs the parsing work
+__MIN_CHUNKS_PER_WORKER = 4
+# Bodies shorter than this are always parsed in the calling process: below
+# this size the pool start-up and the pickling of the rows take longer than
+# the parsing itself
+__MIN_PARALLEL_ROWS = 2000
+# Environment variable that caps the number of worker processes used by loadl
+WORKERS_ENV_VAR = "IPYTV_WORKERS"
+# The JSON schema that loadj() validates its input against
+__SCHEMA_PATH = os.path.join(os.path.dirname(__file__), "resources", "schema.json")
+# Size (in bytes) of the blocks in which remote playlists are downloaded
+__DOWNLOAD_CHUNK_SIZE = 64 * 1024
+# name="value" (or name=value) pairs of the #EXTM3U row; quoted values can contain spaces
+__HEADER_ATTRIBUTE_REGEX = re.compile(r'"?([^\s="]+)"?=(?:"([^"]*)"|(\S*))')
+# A search pattern with none of these characters is a plain literal string
+_REGEX_METACHARACTERS = frozenset(".^$*+?{}[]\\|()")
+# A function telling whether a value matches a search pattern. Its result is
+# only tested for truthiness, so a compiled pattern's bound fullmatch() method
+# can be used as it is, without wrapping it in a (slower) Python function.
+_Matcher = Callable[[str], Any]
+# The re.Pattern methods that search() can match attributes with
+_MATCH_MODES = ("fullmatch", "match", "search")
+
+
+def _build_session() -> requests.Session:
+    # A shared session keeps connections alive across loadu() calls, so that
+    # loading several playlists from the same host doesn't pay a new TCP/TLS
+    # handshake every time
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(total=2, backoff_factor=0.3)
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+_session = _build_session()
+
+
+def set_session(session: requests.Session) -> None:
+    """
+    .. py:function:: set_session(session)
+
+    Replaces the HTTP session used by loadu(), e.g. to share an already
+    configured session (proxies, authentication, custom headers or pooling)
+    with the rest of an application.
+
+    :param  session:    The session that loadu() shall use from now on.
+    :type   session:    requests.Session
+    """
+    global _session  # pylint: disable=global-statement
+    if not isinstance(session, requests.Session):
+        log.error("expected %s, got %s", requests.Session, type(session))
+        raise WrongTypeException("Wrong type: requests.Session expected")
+    _session = session
+
+
+# The worker pool is created on the first parallel parsing and then reused by
+# the following loadl() calls, so that the processes are spawned only once.
+# The pool is tied to the process that spawned it: a forked child can't use
+# the parent's pool (its handler threads don't survive the fork) and builds
+# its own instead.
+_pool: Optional[Pool] = None
+_pool_size = 0
+_pool_pid = 0
+_pool_lock = threading.Lock()
+
+
+def _reset_pool_lock() -> None:
+    # A fork taken while another thread was dispatching would leave the child
+    # with a lock that nobody is ever going to release
+    global _pool_lock  # pylint: disable=global-statement
+    _pool_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_pool_lock)
+
+
+def _get_pool(workers: int) -> Pool:
+    # The caller must hold _pool_lock for as long as it uses the pool, so that
+    # no other thread can replace (and close) it in the meantime
+    global _pool, _pool_size, _pool_pid  # pylint: disable=global-statement
+    if _pool_pid != os.getpid():
+        # The pool (if any) belongs to the parent process: it's just dropped
+        _pool = None
+        _pool_size = 0
+    if _pool is None or _pool_size < workers:
+        if _pool is not None:
+            _pool.close()
+        log.debug("spawning a pool of %s processes", workers)
+        _pool = mp.Pool(processes=workers)
+        _pool_size = workers
+        _pool_pid = os.getpid()
+    return _pool
+
+
+def _map_in_pool(workers: int, func: Callable, iterable: Iterable) -> List:
+    # The results are collected while holding the lock, see _get_pool()
+    with _pool_lock:
+        return list(_get_pool(workers).imap_unordered(func, iterable))
+
+
+@atexit.register
+def close_pool() -> None:
+    """
+    .. py:function:: close_pool()
+
+    Shuts down the worker processes used to parse big playlists in parallel.
+    The pool is otherwise kept alive until the interpreter exits, so that it
+    can be reused by the following loads. A new pool is spawned if another
+    big playlist is loaded afterwards.
+    """
+    global _pool, _pool_size  # pylint: disable=global-statement
+    with _pool_lock:
+        if _pool is not None and _pool_pid == os.getpid():
+            _pool.close()
+            _pool.join()
+            _pool = None
+            _pool_size = 0
 
 
 class M3UPlaylist:
@@ -91,14 +224,14 @@ class M3UPlaylist:
     """
     NO_GROUP_KEY = '_NO_GROUP_'
     NO_URL_KEY = '_NO_URL_'
+    __slots__ = ('_channels', '_attributes')
 
     def __init__(self):
         self._channels: List[IPTVChannel] = []
         self._attributes: Dict[str, str] = {}
-        self._iter_index: int = -1
 
     def length(self) -> int:
-        return len(self.get_channels()) if self.get_channels() is not None else 0
+        return len(self._channels)
 
     def _check_attribute(self, name: str) -> None:
         if name not in self._attributes:
@@ -143,7 +276,7 @@ class M3UPlaylist:
         return attribute
 
     def _check_index(self, index: int) -> None:
-        length = self.length()
+        length = len(self._channels)
         if index < 0 or index >= length:
             log.error(
                 "the index %s is out of the (0, %s) range",
@@ -154,72 +287,71 @@ class M3UPlaylist:
 
     def get_channel(self, index: int) -> IPTVChannel:
         self._check_index(index)
-        return self.get_channels()[index]
+        return self._channels[index]
 
     def get_channels(self) -> List[IPTVChannel]:
         return self._channels
 
     def insert_channel(self, index: int, channel: IPTVChannel) -> None:
         self._check_index(index)
-        self.get_channels().insert(index, channel)
-        log.info("channel %s inserted in position %s", channel, index)
+        self._channels.insert(index, channel)
+        if log.isEnabledFor(logging.INFO):
+            log.info("channel %s inserted in position %s", channel, index)
 
     def insert_channels(self, index: int, chan_list: List[IPTVChannel]) -> None:
         self._check_index(index)
-        for i in range(len(chan_list), 0, -1):
-            self.insert_channel(index, chan_list[i])
+        self._channels[index:index] = chan_list
         log.info("%s channels inserted to the playlist in position %s", len(chan_list), index)
 
     def append_channel(self, channel: IPTVChannel) -> None:
-        self.get_channels().append(channel)
-        log.info("channel added: %s", channel)
+        self._channels.append(channel)
 
     def append_channels(self, chan_list: List[IPTVChannel]) -> None:
-        self._channels += chan_list
+        self._channels.extend(chan_list)
         log.info("%s channels appended to the playlist", len(chan_list))
 
     def update_channel(self, index: int, channel: IPTVChannel) -> None:
         self._check_index(index)
         self._channels[index] = channel
-        log.info("index %s has been updated with channel %s", str(index), channel)
+        if log.isEnabledFor(logging.INFO):
+            log.info("index %s has been updated with channel %s", index, channel)
 
     def remove_channel(self, index: int) -> IPTVChannel:
         self._check_index(index)
         channel = self._channels[index]
         del self._channels[index]
-        log.info("the channel with index %s has been deleted", str(index))
+        log.info("the channel with index %s has been deleted", index)
         return channel
 
     def _build_header(self) -> str:
-        out = M3U_HEADER_TAG
-        for k, v in self._attributes.items():
-            out += f' {k}="{v}"'
-        return out
+        return M3U_HEADER_TAG + "".join(f' {k}="{v}"' for k, v in self._attributes.items())
 
     def group_by_attribute(self, attribute: str = IPTVAttr.GROUP_TITLE.value,
                            include_no_group: bool = True) -> Dict:
-        groups: Dict[str, List] = {}
-        for i, chan in enumerate(self.get_channels()):
-            group = self.NO_GROUP_KEY
-            if attribute in chan.attributes and len(chan.attributes[attribute]) > 0:
-                group = chan.attributes[attribute]
-            elif not include_no_group:
-                continue
-            groups.setdefault(group, [])
+        groups: Dict[str, List] = defaultdict(list)
+        no_group_key = self.NO_GROUP_KEY
+        for i, chan in enumerate(self._channels):
+            # a single lookup, both for missing and for empty values
+            group = chan.attributes.get(attribute)
+            if not group:
+                if not include_no_group:
+                    continue
+                group = no_group_key
             groups[group].append(i)
-        return groups
+        return dict(groups)
 
     def group_by_url(self, include_no_group: bool = True) -> Dict[str, List]:
-        groups: Dict[str, List] = {}
-        for i, chan in enumerate(self.get_channels()):
-            group = self.NO_URL_KEY
-            if len(chan.url) > 0:
+        groups: Dict[str, List] = defaultdict(list)
+        no_url_key = self.NO_URL_KEY
+        for i, chan in enumerate(self._channels):
+            if chan.url:
                 group = chan.url
-            elif not include_no_group:
+            elif include_no_group:
+                group = no_url_key
+            else:
                 continue
-            groups.setdefault(group, [])
             groups[group].append(i)
-        return groups
+        return dict(groups)
 
     @staticmethod
     def _decode_where(where: str) -> Tuple[str, Union[str, None]]:
@@ -231,44 +363,55 @@ class M3UPlaylist:
         return "", None
 
     @staticmethod
-    def _extract_fields(ch: IPTVChannel) -> List[str]:
-        out = []
-        mains = list(vars(ch))
-        for main in mains:
-            value = getattr(ch, main)
-            if isinstance(value, list):
-                for key, _ in enumerate(value):
-                    out.append(f"{main}.{key}")
-            elif isinstance(value, dict):
-                for key, _ in value.items():
-                    out.append(f"{main}.{key}")
-            else:
-                out.append(main)
-        return out
+    def _get_matcher(regex: Union[str, re.Pattern, _Matcher],
+                     case_sensitive: bool = True, mode: str = "fullmatch") -> _Matcher:
+        # Returns a function telling whether a value matches the regex (with
+        # the given re.Pattern method). Already built matchers are returned as
+        # they are, while compiled patterns are used with their own flags
+        # (case_sensitive is ignored).
+        if callable(regex):
+            return regex
+        if isinstance(regex, re.Pattern):
+            return getattr(regex, mode)
+        return _build_string_matcher(regex, case_sensitive is not False, mode)
 
     @staticmethod
-    def _match_all(ch: IPTVChannel, regex: str, case_sensitive: bool = True) -> bool:
-        channel_fields = M3UPlaylist._extract_fields(ch)
-        for field in channel_fields:
-            if M3UPlaylist._match_single(ch, regex, field, case_sensitive=case_sensitive):
+    def _match_all(ch: IPTVChannel, regex: Union[str, re.Pattern, _Matcher],
+                   case_sensitive: bool = True) -> bool:
+        matcher = M3UPlaylist._get_matcher(regex, case_sensitive)
+        # The channel fields are walked in place (rather than listing them as
+        # "main.sub" strings to be decoded again by _match_single)
+        for value in vars(ch).values():
+            if isinstance(value, list):
+                for item in value:
+                    if matcher(item):
+                        return True
+            elif isinstance(value, dict):
+                for item in value.values():
+                    if matcher(item):
+                        return True
+            elif matcher(value):
                 return True
         return False
 
     @staticmethod
-    def _match_single(ch: IPTVChannel, regex: str, where: str, case_sensitive: bool = True) -> bool:
-        flags: re.RegexFlag = re.IGNORECASE if case_sensitive is False else re.RegexFlag(0)
+    def _match_single(ch: IPTVChannel, regex: Union[str, re.Pattern, _Matcher], where: str,
+                      case_sensitive: bool = True) -> bool:
         main, sub = M3UPlaylist._decode_where(where)
+        return M3UPlaylist._match_decoded(ch, M3UPlaylist._get_matcher(regex, case_sensitive), main, sub)
+
+    @staticmethod
+    def _match_decoded(ch: IPTVChannel, matcher: _Matcher, main: str, sub: Optional[str]) -> bool:
         value = getattr(ch, main)
         if sub is not None:
             if isinstance(value, list):
                 value = value[int(sub)]
             elif isinstance(value, dict):
                 value = value[sub]
-        if re.fullmatch(regex, value, flags=flags) is None:
-            return False
-        return True
+        return bool(matcher(value))
 
-    def search(self, regex: str, where: Union[Optional[str], List[str]] = None, case_sensitive: bool = True) -> List[IPTVChannel]:
+    def search(self, regex: str, where: Union[Optional[str], List[str]] = None, case_sensitive: bool = True,
+               mode: str = "fullmatch") -> List[IPTVChannel]:
         """
         .. py:method:: search
 
@@ -289,42 +432,48 @@ class M3UPlaylist:
                                 match shall be done in a case-sensitive fashion
                                 or not.
         :type   case_sensitive: bool
+        :param  mode:   Optional. How the regex is matched against an
+                        attribute: "fullmatch" (the default) requires the
+                        whole value to match, "match" only its beginning and
+                        "search" any part of it. With "search", a substring
+                        pattern like "news" is much faster than ".*news.*".
+        :type   mode:   str
 
         :return:    a list of IPTVChannel objects one or more attributes of
                     which match the search pattern.
         :rtype:     List[IPTVChannel]
         """
-        output_list: List[IPTVChannel] = []
-        for ch in self.get_channels():
-            if where is None:
-                if self._match_all(ch, regex, case_sensitive):
-                    output_list.append(ch)
-            else:
-                if not isinstance(where, list):
-                    where = [where]
-                for w in where:
-                    if self._match_single(ch, regex, w, case_sensitive):
-                        output_list.append(ch)
-                        # One match is enough
-                        break
-        return output_list
+        if mode not in _MATCH_MODES:
+            log.error("unsupported match mode %s (expected one of %s)", mode, _MATCH_MODES)
+            raise WrongTypeException(f"Wrong match mode: one of {_MATCH_MODES} expected")
+        matcher = self._get_matcher(regex, case_sensitive, mode)
+        if where is None:
+            return [ch for ch in self._channels if self._match_all(ch, matcher)]
+        if not isinstance(where, list):
+            where = [where]
+        # The "where" strings are decoded once for the whole search
+        decoded_where = [self._decode_where(w) for w in where]
+        match_decoded = self._match_decoded
+        # any() stops at the first matching field, as one match is enough
+        return [
+            ch for ch in self._channels
+            if any(match_decoded(ch, matcher, main, sub) for main, sub in decoded_where)
+        ]
 
     def to_m3u_plus_playlist(self) -> str:
-        out = f"{self._build_header()}\n"
-        for channel in self.get_channels():
-            out += channel.to_m3u_plus_playlist_entry()
-        return out
+        parts = [self._build_header(), "\n"]
+        parts.extend(channel.to_m3u_plus_playlist_entry() for channel in self._channels)
+        return "".join(parts)
 
     def to_m3u8_playlist(self) -> str:
-        out = f"{m3u.M3U_HEADER_TAG}\n"
-        for channel in self.get_channels():
-            out += channel.to_m3u8_playlist_entry()
-        return out
+        parts = [m3u.M3U_HEADER_TAG, "\n"]
+        parts.extend(channel.to_m3u8_playlist_entry() for channel in self._channels)
+        return "".join(parts)
 
     def __to_dict(self) -> Dict[str, Any]:
         out = {
             "attributes": self.get_attributes(),
-            "channels": [ch.to_dict() for ch in self.get_channels()]
+            "channels": [ch.to_dict() for ch in self._channels]
         }
         return out
 
@@ -336,47 +485,81 @@ class M3UPlaylist:
 
     def copy(self) -> 'M3UPlaylist':
         new_pl = M3UPlaylist()
-        for channel in self.get_channels():
-            new_pl.append_channel(channel.copy())
-        new_pl.add_attributes(
-            self.get_attributes().copy()     # shallow copy is ok, as we're dealing with primitive types
-        )
+        # The new playlist is filled directly, as the channels and attributes
+        # don't need to go through the checks (and logs) of the public methods;
+        # new_pl is an instance of this very class, so its members are ours too
+        # pylint: disable=protected-access
+        new_pl._channels = [channel.copy() for channel in self._channels]
+        new_pl._attributes = self._attributes.copy()    # shallow copy is ok, as we're dealing with primitive types
+        # pylint: enable=protected-access
         return new_pl
 
     def __eq__(self, other: object) -> bool:
-        length = self.length()
-        if not isinstance(other, M3UPlaylist) or \
-                other.length() != length:
-            return False
-        if not other.get_attributes() == self.get_attributes():
+        if not isinstance(other, M3UPlaylist):
             return False
-        for i, ch in enumerate(self):
-            if not other.get_channel(i) == ch:
-                return False
-        return True
-
-    def __ne__(self, other: object) -> bool:
-        return not self == other
+        # cheapest checks first; list equality then compares the channels
+        # pairwise (via IPTVChannel.__eq__) and stops at the first mismatch
+        return len(self._channels) == len(other._channels) and \
+            self._attributes == other._attributes and \
+            self._channels == other._channels
 
     def __str__(self) -> str:
         return self.to_m3u_plus_playlist()
 
-    def __iter__(self) -> 'M3UPlaylist':
-        self._iter_index = 0
-        return self
-
-    def __next__(self) -> IPTVChannel:
-        if self._iter_index >= self.length():
-            raise StopIteration
-        next_chan = self.get_channel(self._iter_index)
-        self._iter_index += 1
-        return next_chan
-
-
-def loadl(rows: List) -> 'M3UPlaylist':
-    if not isinstance(rows, List):
-        log.error("expected %s, got %s", type([]), type(rows))
-        raise WrongTypeException("Wrong type: List expected")
+    # The sequence protocol maps straight onto the channel list, so that len(),
+    # indexing and "in" run at C level (unlike length() and get_channel(),
+    # which raise IndexOutOfBoundsException rather than IndexError)
+    def __len__(self) -> int:
+        return len(self._channels)
+
+    def __getitem__(self, index: int) -> IPTVChannel:
+        return self._channels[index]
+
+    def __contains__(self, channel: object) -> bool:
+        return channel in self._channels
+
+    def __iter__(self) -> Iterator[IPTVChannel]:
+        # a fresh iterator over the channel list, so that nested (or concurrent)
+        # loops over the same playlist don't share any state
+        return iter(self._channels)
+
+
+@functools.lru_cache(maxsize=512)
+def _build_string_matcher(regex: str, case_sensitive: bool, mode: str = "fullmatch") -> _Matcher:
+    # Matchers are cached (with a bounded size, like re's own pattern cache)
+    # so that repeated searches with the same pattern skip building them
+    flags: re.RegexFlag = re.RegexFlag(0) if case_sensitive else re.IGNORECASE
+    pattern = re.compile(regex, flags=flags)
+    if not _REGEX_METACHARACTERS.isdisjoint(regex):
+        return getattr(pattern, mode)
+    # A literal pattern can only match an identical string (or prefix, or
+    # substring), so a plain string operation is enough (and much faster
+    # than the regex engine)
+    if case_sensitive:
+        if mode == "search":
+            return lambda value: regex in value
+        if mode == "match":
+            return lambda value: value.startswith(regex)
+        return lambda value: value == regex
+    if mode != "fullmatch":
+        return getattr(pattern, mode)
+    if regex.isascii():
+        lowered = regex.lower()
+        # re.IGNORECASE knows some non-ASCII case equivalences that
+        # str.lower() doesn't, so non-ASCII values go through the regex
+        return lambda value: value.lower() == lowered if value.isascii() \
+            else pattern.fullmatch(value) is not None
+    return pattern.fullmatch
+
+
+def loadl(rows: Iterable[str], workers: Optional[int] = None) -> 'M3UPlaylist':
+    # Any iterable of rows (e.g. a list or an open file) is accepted, but not a
+    # plain string, which would be iterated character by character, nor a set
+    # (with no order at all) or a dict (which is a mapping, not a sequence)
+    if isinstance(rows, (str, bytes, abc.Set, abc.Mapping)) or not isinstance(rows, abc.Iterable):
+        log.error("expected an iterable of rows, got %s", type(rows))
+        raise WrongTypeException("Wrong type: iterable of rows expected")
+    # the rows are materialized here, in the same pass that drops blank rows
     rows = _remove_blank_rows(rows)
     pl_len = len(rows)
     if pl_len < 1:
@@ -395,32 +578,23 @@ def loadl(rows: List) -> 'M3UPlaylist':
     # We're parsing an empty playlist, so we return an empty playlist object
     if pl_len <= 1:
         return out_pl
-    cores = mp.cpu_count()
-    log.debug("%s cores detected", cores)
     body = rows[1:]
-    chunks = _chunk_body(body, cores)
-    results: List[AsyncResult] = []
-    log.debug("spawning a pool of processes (one per core) to parse the playlist")
-    with mp.Pool(processes=cores) as pool:
-        for chunk in chunks:
-            beginning = chunk["beginning"]
-            end = chunk["end"]
-            log.debug(
-                "assigning a \"populate\" task (beginning: %s, end: %s) to a process in the pool",
-                beginning,
-                end
-            )
-            result = pool.apply_async(_populate, (body, beginning, end))
-            results.append(result)
-        log.debug("closing workers")
-        pool.close()
-        log.debug("workers closed")
-        log.debug("waiting for workers termination")
-        pool.join()
-        log.debug("workers terminated")
-        for result in results:
-            p_list = result.get()
-            out_pl.append_channels(p_list.get_channels())
+    workers = _get_worker_count(len(body), workers)
+    if workers < 2:
+        log.debug("parsing the playlist in the current process")
+        out_pl.append_channels(_populate(body).get_channels())
+        return out_pl
+    chunks = _chunk_body(body, workers)
+    log.debug("parsing the playlist in %s chunks with %s processes", len(chunks), workers)
+    # Only the rows of each chunk are shipped to the workers, so that the body
+    # is pickled once overall rather than once per task.
+    slices = enumerate(body[beginning:end + 1] for beginning, end in chunks)
+    # Chunks are collected as soon as any worker completes them and put back
+    # in playlist order through their index.
+    results: List[List[IPTVChannel]] = [[] for _ in chunks]
+    for index, channels in _map_in_pool(workers, _populate_indexed_chunk, slices):
+        results[index] = channels
+    out_pl.append_channels(list(chain.from_iterable(results)))
     return out_pl
 
 
@@ -436,8 +610,7 @@ def loadf(filename: str) -> 'M3UPlaylist':
         log.error("expected %s, got %s", type(''), type(filename))
         raise WrongTypeException("Wrong type: string expected")
     with open(filename, encoding='utf-8') as file:
-        buffer = file.readlines()
-        return loadl(buffer)
+        return loadl(file)
 
 
 def loadu(url: str) -> 'M3UPlaylist':
@@ -445,12 +618,28 @@ def loadu(url: str) -> 'M3UPlaylist':
         log.error("expected %s, got %s", type(''), type(url))
         raise WrongTypeException("Wrong type: string expected")
     try:
-        response = requests.get(url, timeout=10)
-        if response.ok:
-            return loads(response.text)
-        raise URLException(
-            f"Failure while opening {url}.\nResponse status code: {response.status_code}"
-        )
+        with _session.get(url, timeout=10, stream=True) as response:
+            if not response.ok:
+                raise URLException(
+                    f"Failure while opening {url}.\nResponse status code: {response.status_code}"
+                )
+            if response.encoding is None:
+                # With no charset declared, the encoding is detected from the
+                # whole body (as response.text does), so it can't be streamed
+                return loads(response.text)
+            if response.encoding.lower().replace("_", "-") in ("utf-8", "utf8"):
+                # A leading BOM would otherwise end up in the #EXTM3U row
+                response.encoding = "utf-8-sig"
+            # The body is decoded and split into rows while it's being
+            # downloaded and the rows are handed to loadl() as they come, so
+            # the whole playlist is never held as one string
+            # (with decode_unicode=True and a known encoding, iter_lines() yields str rows)
+            rows = typing.cast(Iterator[str], response.iter_lines(
+                chunk_size=__DOWNLOAD_CHUNK_SIZE,
+                decode_unicode=True,
+                delimiter="\n"
+            ))
+            return loadl(rows)
     except RequestException as exception:
         log.error(
             "failure while opening %s: %s",
@@ -462,33 +651,41 @@ def loadu(url: str) -> 'M3UPlaylist':
         ) from exception
 
 
-def loadj(json_dict: typing.Dict[str, Any]) -> 'M3UPlaylist':
+def loadj(json_dict: typing.Dict[str, Any], validate: bool = True) -> 'M3UPlaylist':
+    # With validate=False the (costly) schema validation is skipped for trusted
+    # input: a structurally broken document is still detected while building
+    # the playlist, and then validated to report a precise error, but values
+    # of the wrong type are accepted as they are.
     if not isinstance(json_dict, dict):
         log.error("expected %s, got %s", dict, type(json_dict))
         raise WrongTypeException("Wrong type: json dict expected")
-    with open("ipytv/resources/schema.json", "r", encoding="utf-8") as schema_file:
-        schema = json.load(schema_file)
-        try:
-            jsonschema.validate(json_dict, schema=schema)
-        except jsonschema.exceptions.ValidationError as e:
-            raise WrongTypeException(f"The input JSON string does not match the expected schema: {e.message}") from e
-    pl = M3UPlaylist()
-    if "attributes" in json_dict:
-        pl.add_attributes(json_dict["attributes"])
-    if "channels" in json_dict:
-        for json_ch in json_dict["channels"]:
-            ch = IPTVChannel(
-                url=json_ch["url"],
-                name=json_ch["name"],
-                duration=json_ch["duration"],
-                attributes=json_ch["attributes"],
-                extras=json_ch["extras"]
-            )
-            pl.append_channel(ch)
+    if validate:
+        _validate_json(json_dict)
+    try:
+        pl = M3UPlaylist()
+        if "attributes" in json_dict:
+            pl.add_attributes(json_dict["attributes"])
+        if "channels" in json_dict:
+            pl.append_channels([
+                IPTVChannel(
+                    url=json_ch["url"],
+                    name=json_ch["name"],
+                    duration=json_ch["duration"],
+                    attributes=json_ch["attributes"],
+                    extras=json_ch["extras"]
+                )
+                for json_ch in json_dict["channels"]
+            ])
+    except (KeyError, TypeError, AttributeError) as e:
+        if validate:
+            raise
+        _validate_json(json_dict)
+        log.error("the JSON document can't be loaded: %s", e)
+        raise WrongTypeException(f"The input JSON string does not match the expected schema: {e}") from e
     return pl
 
 
-def loadjstr(json_str: str) -> 'M3UPlaylist':
+def loadjstr(json_str: str, validate: bool = True) -> 'M3UPlaylist':
     if not isinstance(json_str, str):
         log.error("expected %s, got %s", type(''), type(json_str))
         raise WrongTypeException("Wrong type: string expected")
@@ -497,52 +694,88 @@ def loadjstr(json_str: str) -> 'M3UPlaylist':
     except json.JSONDecodeError as e:
         log.error("failure while decoding the JSON string: %s", e)
         raise WrongTypeException("The input string should be a valid JSON string.") from e
-    return loadj(data)
+    return loadj(data, validate)
+
 
+def _validate_json(json_dict: typing.Dict[str, Any]) -> None:
+    # same error selection as jsonschema.validate(), minus the per-call schema checks
+    error = jsonschema.exceptions.best_match(_get_json_validator().iter_errors(json_dict))
+    if error is not None:
+        log.error("the JSON document does not match the expected schema: %s", error.message)
+        raise WrongTypeException(f"The input JSON string does not match the expected schema: {error.message}") \
+            from error
 
-def _remove_blank_rows(rows: List[str]) -> List[str]:
-    new_list = []
-    for row in rows:
-        if not m3u.is_empty_row(row):
-            new_list.append(row)
-    return new_list
+
+@functools.lru_cache(maxsize=None)
+def _get_json_validator() -> Any:
+    # The schema is read, checked and turned into a validator only once, rather
+    # than on every loadj() call (as jsonschema.validate() would do)
+    with open(__SCHEMA_PATH, "r", encoding="utf-8") as schema_file:
+        schema = json.load(schema_file)
+    validator_class = jsonschema.validators.validator_for(schema)
+    validator_class.check_schema(schema)
+    return validator_class(schema)
+
+
+def _get_worker_count(body_length: int, workers: Optional[int] = None) -> int:
+    if body_length < __MIN_PARALLEL_ROWS:
+        return 1
+    if workers is None:
+        env_workers = os.environ.get(WORKERS_ENV_VAR)
+        if env_workers:
+            try:
+                workers = int(env_workers)
+            except ValueError:
+                log.warning("ignoring %s as its value is not an integer: %s", WORKERS_ENV_VAR, env_workers)
+    if workers is None:
+        workers = mp.cpu_count()
+        log.debug("%s cores detected", workers)
+    # Small playlists are not worth splitting among many processes
+    workers = max(1, min(workers, body_length // (__MIN_CHUNK_SIZE * __MIN_CHUNKS_PER_WORKER)))
+    log.debug("%s worker(s) will be used to parse %s rows", workers, body_length)
+    return workers
+
+
+def _remove_blank_rows(rows: Iterable[str]) -> List[str]:
+    # same check as m3u.is_empty_row(), inlined to avoid a call per row
+    return [row for row in rows if row and not row.isspace()]
 
 
 def _parse_header(header: str) -> Dict[str, str]:
-    attrs = header.replace(f'{M3U_HEADER_TAG}', '').lstrip()
-    attributes = {}
-    for attr in attrs.split():
-        entry = attr.split("=")
-        if len(entry) == 2:
-            name = entry[0].replace('"', '')
-            value = entry[1].replace('"', '')
-            attributes[name] = value
-    return attributes
-
-
-def _build_chunk(beginning: int, end: int) -> Dict[str, int]:
+    attrs = header[len(M3U_HEADER_TAG):] if header.startswith(M3U_HEADER_TAG) else header
     return {
-        # beginning is the index of the first element of the current chunk (element included)
-        "beginning": beginning,
-        # end is the index of the last element of the current chunk (element included)
-        "end": end
+        sys.intern(name): quoted_value or unquoted_value.strip('"')
+        for name, quoted_value, unquoted_value in __HEADER_ATTRIBUTE_REGEX.findall(attrs)
     }
 
 
-def _find_chunk_end(sub_list: List[str]) -> int:
-    for offset, row in enumerate(sub_list):
-        if m3u.is_url_row(row):
-            log.debug(
-                "chunking at the following row (offset %s) as it's a url row:\n%s",
-                offset,
-                row
-            )
-            return offset
-    # offset is the position relative to sub_list where the first url row has been found
-    return len(sub_list)
+def _build_chunk(beginning: int, end: int) -> Tuple[int, int]:
+    # beginning is the index of the first element of the current chunk (element included)
+    # end is the index of the last element of the current chunk (element included)
+    return beginning, end
 
 
-def _compute_chunk(rows: List, start: int, min_size: int) -> Dict[str, int]:
+def _find_chunk_end(rows: List[str], start: int = 0) -> int:
+    # offset is the position relative to start where the first url row has
+    # been found (or the amount of remaining rows, if there's no url row left)
+    # the rows are walked by index, so that the search begins right at start
+    # instead of stepping over all the rows before it
+    offset = next(
+        (
+            i - start for i in range(start, len(rows))
+            if rows[i] and not rows[i].startswith(M3U_COMMENT_TAG) and not rows[i].isspace()
+        ),
+        None
+    )
+    if offset is None:
+        offset = len(rows) - start
+        log.debug("chunking at offset %s from row %s as there's no url row left", offset, start)
+    else:
+        log.debug("chunking at offset %s from row %s as it's the first url row", offset, start)
+    return offset
+
+
+def _compute_chunk(rows: List, start: int, min_size: int) -> Tuple[int, int]:
     length = len(rows)
     if length - start > min_size:
         log.debug(
@@ -550,10 +783,9 @@ def _compute_chunk(rows: List, start: int, min_size: int) -> Dict[str, int]:
             length - start
         )
         provisional_end = start + min_size - 1
-        # sub_list's first element is potentially the last element of the chunk, but only if it's a url row
-        sub_list = rows[provisional_end:]
+        # the row at provisional_end is potentially the last element of the chunk, but only if it's a url row.
         # Let's grow the current chunk until the first url row
-        offset = _find_chunk_end(sub_list)
+        offset = _find_chunk_end(rows, provisional_end)
         final_end = provisional_end + offset
         log.debug("chunk end found at row %s", final_end)
         return _build_chunk(start, final_end)
@@ -565,9 +797,10 @@ def _compute_chunk(rows: List, start: int, min_size: int) -> Dict[str, int]:
     return _build_chunk(start, length-1)
 
 
-def _chunk_body(rows: List, chunk_count: int, enforce_min_size: bool = True) -> List:
+def _chunk_body(rows: List, chunk_count: int, enforce_min_size: bool = True) -> List[Tuple[int, int]]:
     length = len(rows)
-    chunk_size = math.ceil(length / chunk_count)
+    # ceil(length / chunk_count), in integer arithmetic
+    chunk_size = (length + chunk_count - 1) // chunk_count
     if enforce_min_size and chunk_size < __MIN_CHUNK_SIZE:
         log.debug(
             "no chunking as each of the %s chunks would be smaller than the configured minimum (%s < %s)",
@@ -581,54 +814,73 @@ def _chunk_body(rows: List, chunk_count: int, enforce_min_size: bool = True) ->
     chunk_list = []
     start = 0
     while start < length:
-        chunk: Dict[str, int] = _compute_chunk(rows, start, chunk_size)
+        chunk = _compute_chunk(rows, start, chunk_size)
         chunk_list.append(chunk)
-        start = chunk["end"] + 1
+        start = chunk[1] + 1
     log.debug("chunk_list: %s", chunk_list)
     return chunk_list
 
 
+def _populate_indexed_chunk(indexed_chunk: Tuple[int, List[str]]) -> Tuple[int, List[IPTVChannel]]:
+    index, rows = indexed_chunk
+    return index, _populate(rows).get_channels()
+
+
 def _populate(rows: List, beginning: int = 0, end: int = -1) -> 'M3UPlaylist':
     p_list = M3UPlaylist()
     if end == -1:
         end = len(rows) - 1
     log.debug("populating playlist with rows from %s to %s", beginning, end)
+    # Checking the log level once, rather than letting every per-row
+    # log.debug() call do it, keeps the parsing loop free of useless calls.
+    debug = log.isEnabledFor(logging.DEBUG)
+    # Channels are collected in a local list and handed over to the playlist
+    # in one go, so that no per-channel method call (and log) is needed.
+    channels: List[IPTVChannel] = []
     entry = []
-    previous_row = rows[beginning]
+    previous_row = rows[beginning].strip()
     if m3u.is_comment_or_tag_row(previous_row) or m3u.is_url_row(previous_row):
-        entry.append(rows[beginning])
+        entry.append(previous_row)
         log.debug("chunk starting with a url, comment or tag row")
     if m3u.is_url_row(previous_row):
-        _append_entry(entry, p_list)
+        if debug:
+            log.debug("adding entry to the playlist: %s", entry)
+        channels.append(ipytv.channel.from_playlist_entry(entry))
         entry = []
-        log.debug("adding entry to the playlist: %s", entry)
-    for row in rows[beginning + 1: end + 1]:
+    # whether the previous row was an #EXTINF row, carried over so that each
+    # row goes through the startswith() checks only once
+    previous_extinf = previous_row.startswith(M3U_EXTINF_TAG)
+    # The row classification below is the hot path of the whole parsing, so
+    # the m3u.is_*_row() predicates are inlined as plain str.startswith()
+    # calls (rows are stripped and the header is not part of the body, so any
+    # non-empty row not starting with "#" is a url row).
+    for row in islice(rows, beginning + 1, end + 1):
         row = row.strip()
-        log.debug("parsing row: %s", row)
-        if m3u.is_extinf_row(row):
-            if m3u.is_extinf_row(previous_row):
+        if debug:
+            log.debug("parsing row: %s", row)
+        is_extinf = row.startswith(M3U_EXTINF_TAG)
+        if is_extinf:
+            if previous_extinf:
                 # case of two adjacent #EXTINF rows, so a url-less entry is
                 # added. This shouldn't be allowed, but sometimes those #EXTINF
                 # rows are used as group separators.
                 log.warning("adjacent #EXTINF rows detected")
-                _append_entry(entry, p_list)
-                log.debug("adding entry to the playlist: %s", entry)
+                if debug:
+                    log.debug("adding entry to the playlist: %s", entry)
+                channels.append(ipytv.channel.from_playlist_entry(entry))
                 entry = []
             entry.append(row)
-        elif m3u.is_comment_or_tag_row(row):
-            # case of a row with a non-supported tag or a comment, so it's copied as-is
+        elif row.startswith(M3U_COMMENT_TAG):
+            # case of a row with a non-supported tag or a comment, so it's
+            # copied as-is (from_playlist_entry() warns about it)
             entry.append(row)
-            log.warning("commented row or unsupported tag found:\n%s", row)
-        elif m3u.is_url_row(row):
+        elif row:
             # case of a plain url row (regardless if preceded by an #EXTINF row or not)
             entry.append(row)
-            log.debug("adding entry to the playlist: %s", entry)
-            _append_entry(entry, p_list)
+            if debug:
+                log.debug("adding entry to the playlist: %s", entry)
+            channels.append(ipytv.channel.from_playlist_entry(entry))
             entry = []
-        previous_row = row
+        previous_extinf = is_extinf
+    p_list.append_channels(channels)
     return p_list
-
-
-def _append_entry(entry: List, pl: M3UPlaylist):
-    channel = ipytv.channel.from_playlist_entry(entry)
-    pl.append_channel(channel)
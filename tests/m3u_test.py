@@ -40,5 +40,21 @@ class TestGetM3UPlusBrokenAttributes(unittest.TestCase):
             self.assertEqual(value, attributes[name])
 
 
+class TestGetM3UPlusAttributes(unittest.TestCase):
+    def runTest(self):
+        extinf_string = '''#EXTINF:-1 tvg-id="" tvg-name="Io, Leonardo (2019)" tvg-logo="https://image.tmdb.org/t/p/w600_and_h900_bestv2/6DfpPu4iGrBswsyLdJlCwiLCudw.jpg" group-title="Recenti e Oggi al Cinema",Io, Leonardo (2019)'''
+        match = m3u.match_m3u_plus_extinf_row(extinf_string)
+        attributes = m3u.get_m3u_plus_attributes(match.group("attributes_g"))
+        self.assertEqual(
+            {
+                "tvg-id": "",
+                "tvg-name": "Io, Leonardo (2019)",
+                "tvg-logo": "https://image.tmdb.org/t/p/w600_and_h900_bestv2/6DfpPu4iGrBswsyLdJlCwiLCudw.jpg",
+                "group-title": "Recenti e Oggi al Cinema"
+            },
+            attributes
+        )
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,10 +1,12 @@
 import itertools
 import json
+import multiprocessing
 import unittest
 from typing import List, Dict
 
 import httpretty
 import m3u8
+import requests
 from deepdiff import DeepDiff
 
 import ipytv.playlist as playlist
@@ -64,8 +66,8 @@ class TestChunkBody0(unittest.TestCase):
         body += produce_triples(5)  # total 28 rows
         chunks = playlist._chunk_body(body, 2, enforce_min_size=False)
         self.assertEqual(2, len(chunks))
-        self.assertEqual({"beginning": 0, "end": 15}, chunks[0])
-        self.assertEqual({"beginning": 16, "end": 27}, chunks[1])
+        self.assertEqual((0, 15), chunks[0])
+        self.assertEqual((16, 27), chunks[1])
 
 
 class TestChunkBody1(unittest.TestCase):
@@ -75,9 +77,9 @@ class TestChunkBody1(unittest.TestCase):
         body += produce_triples(5)  # total 28 rows
         chunks = playlist._chunk_body(body, 3, enforce_min_size=False)
         self.assertEqual(3, len(chunks))
-        self.assertEqual({"beginning": 0, "end": 10}, chunks[0])
-        self.assertEqual({"beginning": 11, "end": 21}, chunks[1])
-        self.assertEqual({"beginning": 22, "end": 27}, chunks[2])
+        self.assertEqual((0, 10), chunks[0])
+        self.assertEqual((11, 21), chunks[1])
+        self.assertEqual((22, 27), chunks[2])
 
 
 class TestChunkBody2(unittest.TestCase):
@@ -85,11 +87,11 @@ class TestChunkBody2(unittest.TestCase):
         body = produce_singles(50)  # total 50 rows
         chunks = playlist._chunk_body(body, 5, enforce_min_size=False)
         self.assertEqual(5, len(chunks))
-        self.assertEqual({"beginning": 0, "end": 9}, chunks[0])
-        self.assertEqual({"beginning": 10, "end": 19}, chunks[1])
-        self.assertEqual({"beginning": 20, "end": 29}, chunks[2])
-        self.assertEqual({"beginning": 30, "end": 39}, chunks[3])
-        self.assertEqual({"beginning": 40, "end": 49}, chunks[4])
+        self.assertEqual((0, 9), chunks[0])
+        self.assertEqual((10, 19), chunks[1])
+        self.assertEqual((20, 29), chunks[2])
+        self.assertEqual((30, 39), chunks[3])
+        self.assertEqual((40, 49), chunks[4])
 
 
 class TestChunkBody3(unittest.TestCase):
@@ -97,11 +99,11 @@ class TestChunkBody3(unittest.TestCase):
         body = produce_singles(5)   # total 5 rows
         chunks = playlist._chunk_body(body, 5, enforce_min_size=False)
         self.assertEqual(5, len(chunks))
-        self.assertEqual({"beginning": 0, "end": 0}, chunks[0])
-        self.assertEqual({"beginning": 1, "end": 1}, chunks[1])
-        self.assertEqual({"beginning": 2, "end": 2}, chunks[2])
-        self.assertEqual({"beginning": 3, "end": 3}, chunks[3])
-        self.assertEqual({"beginning": 4, "end": 4}, chunks[4])
+        self.assertEqual((0, 0), chunks[0])
+        self.assertEqual((1, 1), chunks[1])
+        self.assertEqual((2, 2), chunks[2])
+        self.assertEqual((3, 3), chunks[3])
+        self.assertEqual((4, 4), chunks[4])
 
 
 class TestChunkBody4(unittest.TestCase):
@@ -111,8 +113,8 @@ class TestChunkBody4(unittest.TestCase):
         body += produce_singles(5)  # total 13 rows
         chunks = playlist._chunk_body(body, 2, enforce_min_size=False)
         self.assertEqual(2, len(chunks))
-        self.assertEqual({"beginning": 0, "end": 7}, chunks[0])
-        self.assertEqual({"beginning": 8, "end": 12}, chunks[1])
+        self.assertEqual((0, 7), chunks[0])
+        self.assertEqual((8, 12), chunks[1])
 
 
 class TestChunkBody5(unittest.TestCase):
@@ -122,10 +124,10 @@ class TestChunkBody5(unittest.TestCase):
         body += produce_doubles(3)  # total 15 rows
         chunks = playlist._chunk_body(body, 4, enforce_min_size=False)
         self.assertEqual(4, len(chunks))
-        self.assertEqual({"beginning": 0, "end": 3}, chunks[0])
-        self.assertEqual({"beginning": 4, "end": 8}, chunks[1])
-        self.assertEqual({"beginning": 9, "end": 12}, chunks[2])
-        self.assertEqual({"beginning": 13, "end": 14}, chunks[3])
+        self.assertEqual((0, 3), chunks[0])
+        self.assertEqual((4, 8), chunks[1])
+        self.assertEqual((9, 12), chunks[2])
+        self.assertEqual((13, 14), chunks[3])
 
 
 class TestLoadlM3UPlusHuge(unittest.TestCase):
@@ -145,6 +147,69 @@ class TestLoadlM3UPlusHuge(unittest.TestCase):
         self.assertEqual(expected_length, pl.length(), "The size of the playlist is not the expected one")
 
 
+class TestLoadlWorkers(unittest.TestCase):
+    def runTest(self):
+        body = produce_triples(500)
+        body += produce_singles(500)
+        body += produce_doubles(500)
+        rows = ["#EXTM3U"] + body
+        expected_length = 1500
+        inline_pl = playlist.loadl(rows, workers=1)
+        self.assertEqual(expected_length, inline_pl.length())
+        pool_pl = playlist.loadl(rows, workers=3)
+        self.assertEqual(inline_pl, pool_pl)
+        self.assertEqual(1, playlist._get_worker_count(100, 8))
+        self.assertEqual(1, playlist._get_worker_count(1999, 8))
+        self.assertEqual(5, playlist._get_worker_count(2000, 8))
+        self.assertEqual(8, playlist._get_worker_count(100000, 8))
+
+
+class TestPoolReuse(unittest.TestCase):
+    def runTest(self):
+        pool = playlist._get_pool(2)
+        self.assertIs(pool, playlist._get_pool(2))
+        self.assertIs(pool, playlist._get_pool(1))
+        bigger_pool = playlist._get_pool(playlist._pool_size + 1)
+        self.assertIsNot(pool, bigger_pool)
+        self.assertIs(bigger_pool, playlist._get_pool(2))
+        playlist.close_pool()
+        self.assertIsNone(playlist._pool)
+        self.assertIsNot(bigger_pool, playlist._get_pool(2))
+
+
+def _load_in_child():
+    rows = ["#EXTM3U"] + produce_triples(1000)
+    pl = playlist.loadl(rows, workers=2)
+    assert pl.length() == 1000
+
+
+@unittest.skipUnless("fork" in multiprocessing.get_all_start_methods(), "fork is not available")
+class TestPoolAfterFork(unittest.TestCase):
+    def runTest(self):
+        rows = ["#EXTM3U"] + produce_triples(1000)
+        playlist.loadl(rows, workers=2)
+        # The child inherits the parent's pool, which it must not reuse
+        child = multiprocessing.get_context("fork").Process(target=_load_in_child)
+        child.start()
+        child.join(timeout=30)
+        if child.is_alive():
+            child.terminate()
+            child.join()
+            self.fail("the forked child hung while parsing the playlist")
+        self.assertEqual(0, child.exitcode)
+
+
+class TestLoadlIterable(unittest.TestCase):
+    def runTest(self):
+        with open("tests/resources/m3u_plus.m3u", encoding="utf-8") as file:
+            rows = file.readlines()
+        pl = playlist.loadl(row for row in rows)
+        self.assertEqual(test_data.expected_m3u_plus, pl)
+        self.assertRaises(WrongTypeException, playlist.loadl, "#EXTM3U")
+        self.assertRaises(WrongTypeException, playlist.loadl, set(rows))
+        self.assertRaises(WrongTypeException, playlist.loadl, dict.fromkeys(rows))
+
+
 class TestLoadlM3UPlusEmptyPlaylist(unittest.TestCase):
     def runTest(self):
         pl = playlist.loadl(["#EXTM3U", ""])
@@ -279,6 +344,64 @@ class TestLoaduM3UPlusWithEmptyPlaylist(unittest.TestCase):
         self.assertEqual(0, pl.length(), "Expected an empty playlist")
 
 
+class TestLoaduM3UPlusUtf8(unittest.TestCase):
+    def runTest(self):
+        url = "http://myown.link:80/luke/playlist.m3u"
+        body = '#EXTM3U\r\n#EXTINF:-1 tvg-name="Caf\u00e9",Caf\u00e9 TV\r\nhttp://myown.link:80/luke/1\r\n'
+        for content_type, encoded_body in [
+            ("application/octet-stream", body.encode("utf-8")),
+            ("application/octet-stream", body.encode("utf-8-sig")),
+            ("audio/x-mpegurl; charset=utf-8", body.encode("utf-8-sig")),
+            ("audio/x-mpegurl; charset=utf-8", body.encode("utf-8"))
+        ]:
+            with httpretty.enabled():
+                httpretty.register_uri(
+                    httpretty.GET,
+                    url,
+                    adding_headers={"Content-Type": content_type},
+                    body=encoded_body,
+                    status=200
+                )
+                pl = playlist.loadu(url)
+            httpretty.disable()
+            httpretty.reset()
+            self.assertEqual(1, pl.length())
+            self.assertEqual("Caf\u00e9 TV", pl.get_channel(0).name)
+            self.assertEqual("Caf\u00e9", pl.get_channel(0).attributes["tvg-name"])
+            self.assertEqual("http://myown.link:80/luke/1", pl.get_channel(0).url)
+
+
+class TestLoaduM3UPlusLatin1(unittest.TestCase):
+    def runTest(self):
+        url = "http://myown.link:80/luke/playlist.m3u"
+        body = '#EXTM3U\n#EXTINF:-1 tvg-name="Caf\u00e9",Caf\u00e9 TV\nhttp://myown.link:80/luke/1\n'
+        for content_type in ["application/octet-stream", "audio/x-mpegurl; charset=iso-8859-1"]:
+            with httpretty.enabled():
+                httpretty.register_uri(
+                    httpretty.GET,
+                    url,
+                    adding_headers={"Content-Type": content_type},
+                    body=body.encode("latin-1"),
+                    status=200
+                )
+                pl = playlist.loadu(url)
+            httpretty.disable()
+            httpretty.reset()
+            self.assertEqual("Caf\u00e9 TV", pl.get_channel(0).name)
+
+
+class TestSetSession(unittest.TestCase):
+    def runTest(self):
+        default_session = playlist._session
+        session = requests.Session()
+        try:
+            playlist.set_session(session)
+            self.assertIs(session, playlist._session)
+            self.assertRaises(WrongTypeException, playlist.set_session, "not a session")
+        finally:
+            playlist.set_session(default_session)
+
+
 class TestLoaduM3U8(unittest.TestCase):
     def runTest(self):
         url = "http://myown.link:80/luke/playlist.m3u"
@@ -334,6 +457,17 @@ class TestLoadjstrWithUnsupportedJson(unittest.TestCase):
         self.assertRaises(WrongTypeException, playlist.loadjstr, json_str)
 
 
+class TestLoadjstrWithoutValidation(unittest.TestCase):
+    def runTest(self):
+        expected_pl = playlist.loadf("tests/resources/m3u_plus.m3u")
+        with open("tests/resources/m3u_plus.json") as json_file:
+            json_str = json_file.read()
+        self.assertEqual(expected_pl, playlist.loadjstr(json_str, validate=False))
+        with open("tests/resources/unsupported.json") as json_file:
+            json_str = json_file.read()
+        self.assertRaises(WrongTypeException, playlist.loadjstr, json_str, validate=False)
+
+
 class TestToM3UPlusPlaylist(unittest.TestCase):
     def runTest(self):
         pl = playlist.loadf("tests/resources/m3u_plus.m3u")
@@ -478,6 +612,18 @@ class TestMatchSingle(unittest.TestCase):
         self.assertFalse(result)
         result = M3UPlaylist._match_single(ch, ".*luke.*", where="url")
         self.assertTrue(result)
+        # Literal patterns (no regex metacharacters) must behave like the regex engine
+        result = M3UPlaylist._match_single(ch, "Rai 1", where="name")
+        self.assertTrue(result)
+        result = M3UPlaylist._match_single(ch, "Rai", where="name")
+        self.assertFalse(result)
+        result = M3UPlaylist._match_single(ch, "rai 1", where="name")
+        self.assertFalse(result)
+        result = M3UPlaylist._match_single(ch, "RAI 1", where="name", case_sensitive=False)
+        self.assertTrue(result)
+        ch_unicode = IPTVChannel(name="\u017fky")
+        result = M3UPlaylist._match_single(ch_unicode, "SKY", where="name", case_sensitive=False)
+        self.assertTrue(result)
 
 
 class TestMatchAll(unittest.TestCase):
@@ -520,6 +666,19 @@ class TestSearch(unittest.TestCase):
         self.assertEqual(1, len(results))
 
 
+class TestSearchModes(unittest.TestCase):
+    def runTest(self):
+        pl = playlist.loadf("tests/resources/m3u_plus.m3u")
+        self.assertEqual(0, len(pl.search("Italia", where="attributes.tvg-logo", mode="search")))
+        self.assertEqual(4, len(pl.search("luke", mode="search")))
+        self.assertEqual(4, len(pl.search("lu.e", mode="search")))
+        self.assertEqual(0, len(pl.search("luke", mode="match")))
+        self.assertEqual(4, len(pl.search("http", where="url", mode="match")))
+        self.assertEqual(2, len(pl.search("ITA", where="attributes.group-title", case_sensitive=False, mode="match")))
+        self.assertEqual(1, len(pl.search("rai", where="name", case_sensitive=False, mode="search")))
+        self.assertRaises(WrongTypeException, pl.search, "luke", mode="find")
+
+
 class TestParseHeader(unittest.TestCase):
     def runTest(self):
         # Case of a header with no attributes
@@ -533,6 +692,16 @@ class TestParseHeader(unittest.TestCase):
         self.assertEqual(attributes['x-tvg-url'], 'https://elcinema.com.epg.xml')
         self.assertEqual(attributes['tvg-shift'], '1')
 
+        # Case of an attribute value containing an equal sign
+        header = '#EXTM3U x-tvg-url="https://epg.link/guide.xml?country=it"'
+        attributes = playlist._parse_header(header)
+        self.assertEqual(attributes['x-tvg-url'], 'https://epg.link/guide.xml?country=it')
+
+        # Case of unquoted values and of a quoted value containing spaces
+        header = '#EXTM3U tvg-shift=1 x-tvg-name="My EPG" catchup=append'
+        attributes = playlist._parse_header(header)
+        self.assertEqual({'tvg-shift': '1', 'x-tvg-name': 'My EPG', 'catchup': 'append'}, attributes)
+
 
 class TestBuildHeader(unittest.TestCase):
     def runTest(self):
@@ -550,6 +719,26 @@ class TestIterator(unittest.TestCase):
         self.assertEqual(i+1, test_data.expected_m3u_plus.length())
 
 
+class TestNestedIterator(unittest.TestCase):
+    def runTest(self):
+        pl = playlist.loadf("tests/resources/m3u_plus.m3u")
+        pairs = [(outer, inner) for outer in pl for inner in pl]
+        self.assertEqual(pl.length() ** 2, len(pairs))
+        self.assertEqual((pl.get_channel(1), pl.get_channel(2)), pairs[pl.length() + 2])
+
+
+class TestSequenceProtocol(unittest.TestCase):
+    def runTest(self):
+        pl = playlist.loadf("tests/resources/m3u_plus.m3u")
+        self.assertEqual(pl.length(), len(pl))
+        self.assertEqual(pl.get_channel(1), pl[1])
+        self.assertEqual(pl.get_channel(pl.length() - 1), pl[-1])
+        self.assertRaises(IndexError, pl.__getitem__, len(pl))
+        self.assertIn(test_data.m3u_plus_channel_2, pl)
+        self.assertNotIn(IPTVChannel(url="http://not.in.the/playlist"), pl)
+        self.assertEqual(0, len(M3UPlaylist()))
+
+
 class TestGetChannel(unittest.TestCase):
     def runTest(self):
         pl = playlist.loadf("tests/resources/m3u_plus.m3u")
@@ -621,6 +810,14 @@ class TestInsertChannels(unittest.TestCase):
         self.assertEqual(pl1.length()*2, pl2.length())
         self.assertEqual(pl1.get_channels(), pl2.get_channels()[:pl1.length()])
         self.assertEqual(pl1.get_channels(), pl2.get_channels()[pl1.length():])
+        # Let's insert the same channels in the middle
+        pl3 = pl1.copy()
+        inserted_index = 1
+        pl3.insert_channels(inserted_index, pl1.get_channels())
+        self.assertEqual(pl1.length()*2, pl3.length())
+        self.assertEqual(pl1.get_channels()[:inserted_index], pl3.get_channels()[:inserted_index])
+        self.assertEqual(pl1.get_channels(), pl3.get_channels()[inserted_index:inserted_index+pl1.length()])
+        self.assertEqual(pl1.get_channels()[inserted_index:], pl3.get_channels()[inserted_index+pl1.length():])
         # Failure case
         self.assertRaises(IndexOutOfBoundsException, pl2.insert_channels, pl2.length(), pl1.get_channels())
 